@@ -6,27 +6,6 @@ Audit:    dbi-audit --root /path/to/data --out ./results
 Convert:  dbi-convert --root /path/to/data --out ./results_nifti --nifti-root ./nifti
 """
 
-from importlib.metadata import version as _version, PackageNotFoundError
-
-try:
-    __version__ = _version("data-birth-integrity")
-except PackageNotFoundError:
-    __version__ = "0.0.0-dev"
-
-from .scoring import (
-    classify_series,
-    composite_dbi,
-    load_yaml_config,
-    score_G,
-    score_M,
-    score_N,
-    score_P,
-    score_S,
-    scanner_cluster_from_ds,
-    series_description,
-    SeriesRow,
-)
-
 __all__ = [
     "classify_series",
     "composite_dbi",
@@ -40,3 +19,25 @@ __all__ = [
     "series_description",
     "SeriesRow",
 ]
+
+
+def __getattr__(name: str):
+    # PEP 562: resolve the re-exports (and the metadata lookup behind
+    # __version__) on first access so `import dbi` stays cheap — the console
+    # scripts pull in pydicom/pandas themselves only when they need them.
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            v = version("data-birth-integrity")
+        except PackageNotFoundError:
+            v = "0.0.0-dev"
+        globals()["__version__"] = v
+        return v
+    if name in __all__:
+        from . import scoring
+
+        value = getattr(scoring, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
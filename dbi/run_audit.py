@@ -20,6 +20,7 @@ import glob
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -33,6 +34,7 @@ try:
         elem_value,
         load_yaml_config,
         recommended_name_for_class,
+        SCANNER_CLUSTER_TAGS,
         scanner_cluster_from_ds,
         score_G,
         score_M,
@@ -50,6 +52,7 @@ except ImportError:
         elem_value,
         load_yaml_config,
         recommended_name_for_class,
+        SCANNER_CLUSTER_TAGS,
         scanner_cluster_from_ds,
         score_G,
         score_M,
@@ -69,8 +72,10 @@ def find_mr_roots(root: Path) -> list[Path]:
 
 
 def first_dicom(scan_dir: Path) -> Path | None:
-    files = sorted(glob.glob(str(scan_dir / "resources" / "DICOM" / "files" / "*.dcm")))
-    return Path(files[0]) if files else None
+    # min() keeps the deterministic "first by name" pick without sorting the
+    # whole file list just to take one element.
+    files = glob.glob(str(scan_dir / "resources" / "DICOM" / "files" / "*.dcm"))
+    return Path(min(files)) if files else None
 
 
 def session_scanner_cluster(mr_root: Path) -> str:
@@ -80,13 +85,18 @@ def session_scanner_cluster(mr_root: Path) -> str:
         if not dcm:
             continue
         try:
-            ds = pydicom.dcmread(str(dcm), stop_before_pixels=True, force=True)
+            ds = pydicom.dcmread(
+                str(dcm), stop_before_pixels=True, force=True, specific_tags=SCANNER_CLUSTER_TAGS
+            )
             return scanner_cluster_from_ds(ds)
         except Exception:
             continue
     return "unknown | unknown | unknownT"
 
 
+_SLUG_RE = re.compile(r"[^\w\-]+")
+
+
 def synthetic_scan_label(ds: pydicom.Dataset) -> str:
     """
     Folder basename substitute for uid-tree layout so P_minimal (^[0-9]+-) and N checks apply.
@@ -98,39 +108,61 @@ def synthetic_scan_label(ds: pydicom.Dataset) -> str:
     except (TypeError, ValueError):
         num = 0
     sd = series_description(ds)
-    slug = re.sub(r"[^\w\-]+", "_", sd).strip("_")[:80] if sd else "series"
+    slug = _SLUG_RE.sub("_", sd).strip("_")[:80] if sd else "series"
     if num > 0:
         return f"{num}-{slug}"
     return f"0-{slug}"
 
 
+# Grouping only needs these four tags; keeping the rest of each header out of
+# the Dataset makes the uid-tree discovery pass much lighter.
+_UID_GROUP_TAGS: list[tuple[int, int]] = [
+    (0x0008, 0x0060),  # Modality
+    (0x0020, 0x000D),  # StudyInstanceUID
+    (0x0020, 0x000E),  # SeriesInstanceUID
+    (0x0020, 0x0013),  # InstanceNumber
+]
+
+
+def _uid_probe(path: Path) -> tuple[tuple[str, str], Path, int] | None:
+    """Read the grouping tags from one file; None for unreadable/non-MR/no-UID."""
+    try:
+        ds = pydicom.dcmread(
+            str(path), stop_before_pixels=True, force=True, specific_tags=_UID_GROUP_TAGS
+        )
+    except Exception:
+        return None
+    if _s_modality(ds) != "MR":
+        return None
+    study = _s_uid(elem_value(ds, (0x0020, 0x000D)))
+    ser = _s_uid(elem_value(ds, (0x0020, 0x000E)))
+    if not study or not ser:
+        return None
+    inn = elem_value(ds, (0x0020, 0x0013))
+    try:
+        inst = int(str(inn).strip()) if inn != "" and inn is not None else 10**9
+    except (TypeError, ValueError):
+        inst = 10**9
+    return (study, ser), path, inst
+
+
 def _collect_uid_series_files(root: Path) -> dict[tuple[str, str], list[tuple[Path, int]]]:
     """
     Map (StudyInstanceUID, SeriesInstanceUID) -> list of (path, InstanceNumber for sort).
     Only MR files with both UIDs are grouped; others skipped.
     """
     groups: dict[tuple[str, str], list[tuple[Path, int]]] = {}
-    for path in sorted(root.rglob("*.dcm")):
-        if not path.is_file():
-            continue
-        try:
-            ds = pydicom.dcmread(str(path), stop_before_pixels=True, force=True)
-        except Exception:
-            continue
-        mod = _s_modality(ds)
-        if mod != "MR":
-            continue
-        study = _s_uid(elem_value(ds, (0x0020, 0x000D)))
-        ser = _s_uid(elem_value(ds, (0x0020, 0x000E)))
-        if not study or not ser:
-            continue
-        inn = elem_value(ds, (0x0020, 0x0013))
-        try:
-            inst = int(str(inn).strip()) if inn != "" and inn is not None else 10**9
-        except (TypeError, ValueError):
-            inst = 10**9
-        key = (study, ser)
-        groups.setdefault(key, []).append((path, inst))
+    paths = [p for p in sorted(root.rglob("*.dcm")) if p.is_file()]
+    if not paths:
+        return groups
+    # The probes are I/O-bound header reads; a small thread pool overlaps them
+    # while executor.map keeps results in the deterministic sorted-path order.
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        for probe in pool.map(_uid_probe, paths):
+            if probe is None:
+                continue
+            key, path, inst = probe
+            groups.setdefault(key, []).append((path, inst))
     for key in groups:
         groups[key].sort(key=lambda t: (t[1], str(t[0])))
     return groups
@@ -156,14 +188,15 @@ def _row_from_dataset(
     scan_path: str,
     cluster: str,
     spatial_cfg: dict,
-    folder_rx: str,
-    proto_pat: str,
+    folder_rx: str | re.Pattern[str],
+    proto_pat: str | re.Pattern[str],
     rules: list,
     deriv_toks: list,
     weights: dict[str, float],
     automation_conventions: list[dict] | None = None,
     class_sd_compliance: dict[str, dict] | None = None,
     derived_scan_naming: dict | None = None,
+    std_cache: dict[tuple[str, str], tuple[str, str]] | None = None,
 ) -> dict:
     sd = series_description(ds)
     combined = f"{scan_name} {sd}"
@@ -192,14 +225,24 @@ def _row_from_dataset(
     }
     dbi = composite_dbi(scores, weights)
 
-    std_cls = standards_classify(sd, class_sd_compliance) if class_sd_compliance else "unclassifiable"
-    naming_ok = cls == std_cls and cls != "other"
+    # Standards classification depends only on (sd, cls); series within a
+    # session frequently share descriptions, so memoize per run when a cache
+    # dict is supplied.
+    key = (sd, cls)
+    if std_cache is not None and key in std_cache:
+        std_cls, gap = std_cache[key]
+        naming_ok = cls == std_cls and cls != "other"
+    else:
+        std_cls = standards_classify(sd, class_sd_compliance) if class_sd_compliance else "unclassifiable"
+        naming_ok = cls == std_cls and cls != "other"
+        gap = (
+            standards_gap_reason(sd, cls, class_sd_compliance)
+            if class_sd_compliance and not naming_ok
+            else "Already compliant"
+        )
+        if std_cache is not None:
+            std_cache[key] = (std_cls, gap)
     rec_name = recommended_name_for_class(cls)
-    gap = (
-        standards_gap_reason(sd, cls, class_sd_compliance)
-        if class_sd_compliance and not naming_ok
-        else "Already compliant"
-    )
 
     return {
         "session_path": session_path,
@@ -239,127 +282,73 @@ def run_audit(
     config_path: Path,
     failure_log: Path | None = None,
     layout: str = "xnat",
+    mr_roots: list[Path] | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame, str]:
     cfg = load_yaml_config(config_path)
     cfg_version = str(cfg.get("version", "unknown"))
     weights = {k: float(v) for k, v in cfg["weights"].items()}
     spatial_cfg = cfg["spatial"]
     naming_cfg = cfg["naming"]
-    proto_pat = cfg["protocol_token"]["pattern"]
+    # Compiled once per run; re.* would otherwise re-resolve these patterns
+    # through its cache for every series.
+    proto_pat = re.compile(cfg["protocol_token"]["pattern"])
     rules = cfg["classification_rules"]
-    folder_rx = naming_cfg["scan_folder_pattern"]
+    folder_rx = re.compile(naming_cfg["scan_folder_pattern"])
     deriv_toks = naming_cfg["derivative_tokens"]
     auto_conv = naming_cfg.get("automation_conventions") or []
     class_sd_comp = naming_cfg.get("class_series_description_compliance") or {}
     derived_naming = naming_cfg.get("derived_scan_naming")
+    std_cache: dict[tuple[str, str], tuple[str, str]] = {}
 
     rows: list[dict] = []
 
+    # One handle for the whole run; reopening per failure costs an open/close
+    # round-trip per unreadable series on large cohorts.
+    fail_fh = open(failure_log, "a", encoding="utf-8") if failure_log else None
+
     def log_failure(scan_path: str, dicom_path: str, message: str) -> None:
-        if not failure_log:
+        if fail_fh is None:
             return
-        line = f"{datetime.now(timezone.utc).isoformat()}\t{scan_path}\t{dicom_path}\t{message}\n"
-        with open(failure_log, "a", encoding="utf-8") as lf:
-            lf.write(line)
-
-    if layout == "uid-tree":
-        groups = _collect_uid_series_files(root)
-        for (study_uid, series_uid), file_list in sorted(groups.items(), key=lambda x: (x[0][0], x[0][1])):
-            dcm_path = file_list[0][0]
-            session_path = f"uid://{study_uid}"
-            session_id = study_uid
-            scan_path = f"uid://{study_uid}/{series_uid}"
-            try:
-                ds = pydicom.dcmread(str(dcm_path), stop_before_pixels=True, force=True)
-            except Exception as e:
-                log_failure(scan_path, str(dcm_path), repr(e))
-                cluster = "unknown | unknown | unknownT"
-                scan_name = series_uid[:16]
-                rows.append(
-                    _empty_row(
-                        session_path,
-                        session_id,
-                        scan_name,
-                        scan_path,
-                        str(dcm_path),
-                        cluster,
-                        f"read_error:{e}",
-                    )
-                )
-                continue
-            scan_name = synthetic_scan_label(ds)
-            cluster = scanner_cluster_from_ds(ds)
-            rows.append(
-                _row_from_dataset(
-                    ds,
-                    dcm_path,
-                    session_path,
-                    session_id,
-                    scan_name,
-                    scan_path,
-                    cluster,
-                    spatial_cfg,
-                    folder_rx,
-                    proto_pat,
-                    rules,
-                    deriv_toks,
-                    weights,
-                    auto_conv,
-                    class_sd_comp,
-                    derived_naming,
-                )
-            )
-    elif layout == "xnat":
-        for mr_root in find_mr_roots(root):
-            cluster = session_scanner_cluster(mr_root)
-            session_id = mr_root.name
-            scans = sorted(glob.glob(str(mr_root / "scans" / "*")))
-            for s in scans:
-                scan_path = Path(s)
-                if not scan_path.is_dir():
-                    continue
-                scan_name = scan_path.name
-                dcm_path = first_dicom(scan_path)
-                err = ""
-                if not dcm_path:
-                    log_failure(str(scan_path), "", "no_dicom")
-                    rows.append(
-                        _empty_row(
-                            str(mr_root),
-                            session_id,
-                            scan_name,
-                            str(scan_path),
-                            "",
-                            cluster,
-                            "no_dicom",
-                        )
-                    )
-                    continue
+        fail_fh.write(
+            f"{datetime.now(timezone.utc).isoformat()}\t{scan_path}\t{dicom_path}\t{message}\n"
+        )
+
+    try:
+        if layout == "uid-tree":
+            groups = _collect_uid_series_files(root)
+            for (study_uid, series_uid), file_list in sorted(groups.items(), key=lambda x: (x[0][0], x[0][1])):
+                dcm_path = file_list[0][0]
+                session_path = f"uid://{study_uid}"
+                session_id = study_uid
+                scan_path = f"uid://{study_uid}/{series_uid}"
                 try:
                     ds = pydicom.dcmread(str(dcm_path), stop_before_pixels=True, force=True)
                 except Exception as e:
-                    log_failure(str(scan_path), str(dcm_path), repr(e))
+                    log_failure(scan_path, str(dcm_path), repr(e))
+                    cluster = "unknown | unknown | unknownT"
+                    scan_name = series_uid[:16]
                     rows.append(
                         _empty_row(
-                            str(mr_root),
+                            session_path,
                             session_id,
                             scan_name,
-                            str(scan_path),
+                            scan_path,
                             str(dcm_path),
                             cluster,
                             f"read_error:{e}",
                         )
                     )
                     continue
-
+                scan_name = synthetic_scan_label(ds)
+                cluster = scanner_cluster_from_ds(ds)
                 rows.append(
                     _row_from_dataset(
                         ds,
                         dcm_path,
-                        str(mr_root),
+                        session_path,
                         session_id,
                         scan_name,
-                        str(scan_path),
+                        scan_path,
                         cluster,
                         spatial_cfg,
                         folder_rx,
@@ -370,40 +359,152 @@ def run_audit(
                         auto_conv,
                         class_sd_comp,
                         derived_naming,
+                        std_cache,
                     )
                 )
-    else:
-        raise ValueError(f"Unknown layout: {layout!r}; use 'xnat' or 'uid-tree'")
+        elif layout == "xnat":
+            if mr_roots is None:
+                mr_roots = find_mr_roots(root)
+            for mr_root in mr_roots:
+                cluster = session_scanner_cluster(mr_root)
+                session_id = mr_root.name
+                scans = sorted(glob.glob(str(mr_root / "scans" / "*")))
+                for s in scans:
+                    scan_path = Path(s)
+                    if not scan_path.is_dir():
+                        continue
+                    scan_name = scan_path.name
+                    dcm_path = first_dicom(scan_path)
+                    err = ""
+                    if not dcm_path:
+                        log_failure(str(scan_path), "", "no_dicom")
+                        rows.append(
+                            _empty_row(
+                                str(mr_root),
+                                session_id,
+                                scan_name,
+                                str(scan_path),
+                                "",
+                                cluster,
+                                "no_dicom",
+                            )
+                        )
+                        continue
+                    try:
+                        ds = pydicom.dcmread(str(dcm_path), stop_before_pixels=True, force=True)
+                    except Exception as e:
+                        log_failure(str(scan_path), str(dcm_path), repr(e))
+                        rows.append(
+                            _empty_row(
+                                str(mr_root),
+                                session_id,
+                                scan_name,
+                                str(scan_path),
+                                str(dcm_path),
+                                cluster,
+                                f"read_error:{e}",
+                            )
+                        )
+                        continue
+
+                    rows.append(
+                        _row_from_dataset(
+                            ds,
+                            dcm_path,
+                            str(mr_root),
+                            session_id,
+                            scan_name,
+                            str(scan_path),
+                            cluster,
+                            spatial_cfg,
+                            folder_rx,
+                            proto_pat,
+                            rules,
+                            deriv_toks,
+                            weights,
+                            auto_conv,
+                            class_sd_comp,
+                            derived_naming,
+                            std_cache,
+                        )
+                    )
+        else:
+            raise ValueError(f"Unknown layout: {layout!r}; use 'xnat' or 'uid-tree'")
+    finally:
+        if fail_fh is not None:
+            fail_fh.close()
 
     series_df = pd.DataFrame(rows)
-    # Session aggregates
-    sess_rows = []
-    for sid, g in series_df.groupby("session_id"):
-        sub = g[g["read_error"].fillna("") == ""]
-        if sub.empty:
-            sub = g
-        loc_mask = sub["series_class"] == "localizer"
-        primary = sub[~loc_mask] if (~loc_mask).any() else sub
-        sess_rows.append(
-            {
-                "session_id": sid,
-                "scanner_cluster": g["scanner_cluster"].iloc[0],
-                "n_series": len(g),
-                "n_scored": len(sub),
-                "DBI_session_mean": primary["DBI"].mean(),
-                "DBI_session_mean_no_localizer": primary["DBI"].mean() if len(primary) else float("nan"),
-                "DBI_session_min": primary["DBI"].min(),
-                "DBI_session_median": primary["DBI"].median(),
-                "mean_M": primary["M"].mean(),
-                "mean_P": primary["P"].mean(),
-                "mean_S": primary["S"].mean(),
-                "mean_N": primary["N"].mean(),
-            }
-        )
-    session_df = pd.DataFrame(sess_rows)
+    if series_df.empty:
+        # Nothing scanned (empty root or no MR series): skip aggregation.
+        return series_df, pd.DataFrame(), cfg_version
+    # Session aggregates — one grouped pass instead of filtering per session.
+    # Tier per row: scored non-localizer series first, then scored localizers,
+    # then unscored rows; each session aggregates over its best available tier
+    # (same fallback the old per-session loop applied).
+    scored = series_df["read_error"].fillna("").eq("")
+    localizer = series_df["series_class"].eq("localizer")
+    tier = (~scored).astype(int) * 2 + localizer.astype(int)
+    sessions = series_df["session_id"]
+    primary = series_df[tier == tier.groupby(sessions).transform("min")]
+
+    n_series = series_df.groupby("session_id").size()
+    n_scored = scored.groupby(sessions).sum().astype(int)
+    n_scored = n_scored.where(n_scored > 0, n_series)
+    agg = primary.groupby("session_id").agg(
+        DBI_session_mean=("DBI", "mean"),
+        DBI_session_min=("DBI", "min"),
+        DBI_session_median=("DBI", "median"),
+        mean_M=("M", "mean"),
+        mean_P=("P", "mean"),
+        mean_S=("S", "mean"),
+        mean_N=("N", "mean"),
+    )
+    session_df = pd.DataFrame(
+        {
+            "session_id": agg.index,
+            "scanner_cluster": series_df.groupby("session_id")["scanner_cluster"].first(),
+            "n_series": n_series,
+            "n_scored": n_scored,
+            "DBI_session_mean": agg["DBI_session_mean"],
+            "DBI_session_mean_no_localizer": agg["DBI_session_mean"],
+            "DBI_session_min": agg["DBI_session_min"],
+            "DBI_session_median": agg["DBI_session_median"],
+            "mean_M": agg["mean_M"],
+            "mean_P": agg["mean_P"],
+            "mean_S": agg["mean_S"],
+            "mean_N": agg["mean_N"],
+        }
+    ).reset_index(drop=True)
     return series_df, session_df, cfg_version
 
 
+# Static fields shared by every unreadable-series row; _empty_row only fills in
+# the per-series identifiers instead of rebuilding the whole 28-key dict.
+_EMPTY_ROW_FIELDS: dict = {
+    "M": float("nan"),
+    "M_pass": 0,
+    "M_total": 0,
+    "P": float("nan"),
+    "P_minimal": float("nan"),
+    "P_ideal": float("nan"),
+    "G": "",
+    "G_na": True,
+    "derivative_series": False,
+    "S": float("nan"),
+    "N": float("nan"),
+    "N_pass": 0,
+    "N_total": 0,
+    "DBI": float("nan"),
+    "has_bvalue_evidence": False,
+    "has_gradient_direction": False,
+    "standards_compliant_class": "",
+    "naming_compliant": False,
+    "recommended_name_pattern": "",
+    "standards_gap": "",
+}
+
+
 def _empty_row(
     session_path: str,
     session_id: str,
@@ -422,46 +523,32 @@ def _empty_row(
         "scanner_cluster": cluster,
         "series_class": "",
         "read_error": err,
-        "M": float("nan"),
-        "M_pass": 0,
-        "M_total": 0,
-        "P": float("nan"),
-        "P_minimal": float("nan"),
-        "P_ideal": float("nan"),
-        "G": "",
-        "G_na": True,
-        "derivative_series": False,
-        "S": float("nan"),
-        "N": float("nan"),
-        "N_pass": 0,
-        "N_total": 0,
-        "DBI": float("nan"),
-        "has_bvalue_evidence": False,
-        "has_gradient_direction": False,
-        "standards_compliant_class": "",
-        "naming_compliant": False,
-        "recommended_name_pattern": "",
-        "standards_gap": "",
+        **_EMPTY_ROW_FIELDS,
     }
 
 
+def _scored_rows(series_df: pd.DataFrame) -> pd.DataFrame:
+    """Rows whose header was actually read (empty read_error), computed once per caller."""
+    return series_df[series_df["read_error"].fillna("") == ""]
+
+
 def write_figures(series_df: pd.DataFrame, session_df: pd.DataFrame, out_dir: Path) -> None:
     try:
         import matplotlib.pyplot as plt
     except ImportError:
         return
 
-    ok = series_df[series_df["read_error"].fillna("") == ""]
+    ok = _scored_rows(series_df)
     if ok.empty:
         return
 
     # Figure 1: DBI by scanner (session mean)
     fig, ax = plt.subplots(figsize=(10, 5))
-    clusters = session_df["scanner_cluster"].unique()
-    data = [
-        session_df[session_df["scanner_cluster"] == c]["DBI_session_mean_no_localizer"].dropna()
-        for c in clusters
-    ]
+    # One grouped pass; sort=False keeps the first-appearance cluster order
+    # that unique() used to give.
+    grouped = session_df.groupby("scanner_cluster", sort=False)["DBI_session_mean_no_localizer"]
+    clusters = list(grouped.groups)
+    data = [g.dropna() for _, g in grouped]
     labels = [c[:40] + "…" if len(c) > 40 else c for c in clusters]
     ax.boxplot(data, tick_labels=labels, showfliers=True)
     ax.set_ylabel("DBI (session mean, localizers excluded)")
@@ -490,7 +577,7 @@ def write_compliance_report(series_df: pd.DataFrame, out_dir: Path) -> Path:
       - compliance_report.csv  (full table for programmatic use)
       - compliance_report.txt  (human-readable summary)
     """
-    ok = series_df[series_df["read_error"].fillna("") == ""].copy()
+    ok = _scored_rows(series_df)
     if ok.empty:
         return out_dir / "compliance_report.txt"
 
@@ -505,8 +592,7 @@ def write_compliance_report(series_df: pd.DataFrame, out_dir: Path) -> Path:
         "N", "DBI", "scanner_cluster", "session_id",
     ]
     report_cols = [c for c in report_cols if c in ok.columns]
-    report_df = ok[report_cols].copy()
-    report_df = report_df.rename(columns={
+    report_df = ok[report_cols].rename(columns={
         "series_class": "heuristic_class",
         "standards_compliant_class": "standards_class",
     })
@@ -517,9 +603,13 @@ def write_compliance_report(series_df: pd.DataFrame, out_dir: Path) -> Path:
     csv_path = out_dir / "compliance_report.csv"
     report_df.to_csv(csv_path, index=False)
 
+    # Boolean columns computed once and reused for the summary and both
+    # detail tables below, instead of re-filtering the frame per count.
+    classified = ok["series_class"] != "other"
+    compliant = ok["naming_compliant"]
     n_total = len(ok)
-    n_classified = len(ok[ok["series_class"] != "other"])
-    n_compliant = int(ok["naming_compliant"].sum())
+    n_classified = int(classified.sum())
+    n_compliant = int(compliant.sum())
     n_gap = n_classified - n_compliant
     n_other = n_total - n_classified
 
@@ -536,8 +626,8 @@ def write_compliance_report(series_df: pd.DataFrame, out_dir: Path) -> Path:
         "",
     ]
 
-    gap_df = ok[(ok["series_class"] != "other") & (~ok["naming_compliant"])]
-    compliant_df = ok[ok["naming_compliant"]]
+    gap_df = ok[classified & ~compliant]
+    compliant_df = ok[compliant]
 
     if n_classified:
         lines.extend([
@@ -546,12 +636,10 @@ def write_compliance_report(series_df: pd.DataFrame, out_dir: Path) -> Path:
             "-" * 72,
             f"  {'Class':<12} {'Total':>6} {'Compliant':>10} {'Gap':>6} {'Rate':>7}",
         ])
-        for cls in sorted(ok["series_class"].unique()):
+        by_class = ok.groupby("series_class")["naming_compliant"].agg(["sum", "size"])
+        for cls, comp, tot in by_class.itertuples():
             if cls == "other":
                 continue
-            sub = ok[ok["series_class"] == cls]
-            comp = sub["naming_compliant"].sum()
-            tot = len(sub)
             rate = comp / tot * 100 if tot else 0
             lines.append(f"  {cls:<12} {tot:>6} {int(comp):>10} {tot - int(comp):>6} {rate:>6.1f}%")
         lines.append("")
@@ -565,12 +653,12 @@ def write_compliance_report(series_df: pd.DataFrame, out_dir: Path) -> Path:
             f"  {'scan_folder':<45} {'heuristic':>10} {'standards':>15}  gap_reason",
             f"  {'-'*44} {'-'*10} {'-'*15}  {'-'*30}",
         ])
-        for _, r in gap_df.iterrows():
-            sf = str(r.get("scan_folder", ""))[:44]
-            hc = str(r.get("series_class", ""))
-            sc = str(r.get("standards_compliant_class", ""))
-            gap = str(r.get("standards_gap", ""))
-            lines.append(f"  {sf:<45} {hc:>10} {sc:>15}  {gap}")
+        gap_cols = gap_df.reindex(
+            columns=["scan_folder", "series_class", "standards_compliant_class", "standards_gap"],
+            fill_value="",
+        )
+        for sf, hc, sc, gap in gap_cols.itertuples(index=False, name=None):
+            lines.append(f"  {str(sf)[:44]:<45} {str(hc):>10} {str(sc):>15}  {gap}")
 
         lines.extend([
             "",
@@ -579,9 +667,8 @@ def write_compliance_report(series_df: pd.DataFrame, out_dir: Path) -> Path:
             "-" * 72,
         ])
         seen = set()
-        for _, r in gap_df.iterrows():
-            cls = r.get("series_class", "")
-            rec = r.get("recommended_name_pattern", "")
+        rec_cols = gap_df[["series_class", "recommended_name_pattern"]]
+        for cls, rec in rec_cols.itertuples(index=False, name=None):
             if cls not in seen and rec:
                 lines.append(f"    {cls:<12}  -->  {rec}")
                 seen.add(cls)
@@ -596,12 +683,11 @@ def write_compliance_report(series_df: pd.DataFrame, out_dir: Path) -> Path:
             f"  {'scan_folder':<45} {'class':>10} {'N':>5} {'DBI':>6}",
             f"  {'-'*44} {'-'*10} {'-'*5} {'-'*6}",
         ])
-        for _, r in compliant_df.head(20).iterrows():
-            sf = str(r.get("scan_folder", ""))[:44]
-            cls = str(r.get("series_class", ""))
-            n_val = r.get("N", 0)
-            dbi_val = r.get("DBI", 0)
-            lines.append(f"  {sf:<45} {cls:>10} {n_val:>5.3f} {dbi_val:>6.3f}")
+        top_cols = compliant_df.head(20).reindex(
+            columns=["scan_folder", "series_class", "N", "DBI"], fill_value=0
+        )
+        for sf, cls, n_val, dbi_val in top_cols.itertuples(index=False, name=None):
+            lines.append(f"  {str(sf)[:44]:<45} {str(cls):>10} {n_val:>5.3f} {dbi_val:>6.3f}")
         if len(compliant_df) > 20:
             lines.append(f"  ... and {len(compliant_df) - 20} more compliant series")
         lines.append("")
@@ -651,19 +737,19 @@ def main() -> None:
     args.out.mkdir(parents=True, exist_ok=True)
 
     fail_log = args.out / "read_failures.log"
-    if fail_log.exists():
-        fail_log.unlink()
     with open(fail_log, "w", encoding="utf-8") as lf:
         lf.write("utc_timestamp\tscan_path\tdicom_path\tmessage\n")
 
+    # Walk the session tree once and share the result with run_audit.
+    mr_roots = find_mr_roots(args.root) if args.layout == "xnat" else None
     meta = {
         "run_utc": datetime.now(timezone.utc).isoformat(),
         "root": str(args.root.resolve()),
         "layout": args.layout,
-        "n_mr_sessions": len(find_mr_roots(args.root)) if args.layout == "xnat" else None,
+        "n_mr_sessions": len(mr_roots) if mr_roots is not None else None,
     }
     series_df, session_df, cfg_version = run_audit(
-        args.root, args.out, args.config, failure_log=fail_log, layout=args.layout
+        args.root, args.out, args.config, failure_log=fail_log, layout=args.layout, mr_roots=mr_roots
     )
     meta["dbi_spec_version"] = cfg_version
     if args.layout == "uid-tree":
@@ -706,8 +792,12 @@ def main() -> None:
     print(f"Wrote {args.out / 'run_metadata.json'}")
     print(f"Wrote {report_path}")
     print(f"Wrote {args.out / 'compliance_report.csv'}")
-    flines = fail_log.read_text(encoding="utf-8").splitlines()
-    n_fail_lines = max(0, len(flines) - 1)
+    # Every failure logged during the run also produced a read_error row, so
+    # count from the frame instead of re-reading the log file we just wrote.
+    if "read_error" in series_df.columns:
+        n_fail_lines = int((series_df["read_error"] != "").sum())
+    else:
+        n_fail_lines = 0
     print(f"Wrote {fail_log} ({n_fail_lines} failure row(s))")
 
 
@@ -18,6 +18,7 @@ NIfTI tree without re-running dcm2niix (e.g. after a long batch where only nifti
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import re
 import shutil
@@ -31,14 +32,27 @@ import pydicom
 
 try:
     from .run_audit import find_mr_roots, first_dicom, session_scanner_cluster
-    from .scoring import classify_series, load_yaml_config, scanner_cluster_from_ds, series_description
+    from .scoring import (
+        SCANNER_CLUSTER_TAGS,
+        classify_series,
+        load_yaml_config,
+        scanner_cluster_from_ds,
+        series_description,
+    )
 except ImportError:
     from run_audit import find_mr_roots, first_dicom, session_scanner_cluster
-    from scoring import classify_series, load_yaml_config, scanner_cluster_from_ds, series_description
+    from scoring import (
+        SCANNER_CLUSTER_TAGS,
+        classify_series,
+        load_yaml_config,
+        scanner_cluster_from_ds,
+        series_description,
+    )
 
 TEXT_CAPTURE_LIMIT = 8000
 
 
+@functools.lru_cache(maxsize=None)
 def get_dcm2niix_version(exe: str) -> str:
     r = subprocess.run(
         [exe, "-v"],
@@ -58,15 +72,17 @@ def dicom_dir_for_scan(scan_path: Path) -> Path:
     return scan_path / "resources" / "DICOM" / "files"
 
 
+_NIFTI_SUFFIXES = (".nii.gz", ".nii")
+
+
 def count_niftis(out_dir: Path) -> tuple[int, str]:
     if not out_dir.exists():
         return 0, ""
-    paths = [
+    paths = sorted(
         p
         for p in out_dir.rglob("*")
-        if p.is_file() and (p.name.endswith(".nii.gz") or p.name.endswith(".nii"))
-    ]
-    paths = sorted(set(paths))
+        if p.is_file() and p.name.endswith(_NIFTI_SUFFIXES)
+    )
     names = [p.name for p in paths]
     sample = ";".join(names[:50]) + (";..." if len(names) > 50 else "")
     return len(paths), sample
@@ -98,28 +114,71 @@ def run_dcm2niix_one(
         return 125, "", repr(e)
 
 
-def series_class_for_scan(scan_path: Path, rules: list) -> str:
-    dcm = first_dicom(scan_path)
-    if not dcm:
-        return ""
-    try:
-        ds = pydicom.dcmread(str(dcm), stop_before_pixels=True, force=True)
-    except Exception:
-        return ""
-    sd = series_description(ds)
-    combined = f"{scan_path.name} {sd}"
-    return classify_series(combined, rules)
+@functools.lru_cache(maxsize=None)
+def _session_cluster_fallback(mr_root: Path) -> str:
+    """session_scanner_cluster, computed on first use and cached per session."""
+    return session_scanner_cluster(mr_root)
 
 
-def scanner_for_series(scan_path: Path, session_fallback: str) -> str:
+def series_class_and_cluster(
+    scan_path: Path, rules: list, mr_root: Path
+) -> tuple[str, str]:
+    """
+    Series class and scanner cluster from a single read of the scan's first DICOM.
+    Falls back to the (lazily computed) session-level cluster when the scan has
+    no readable DICOM, so sessions whose scans all read cleanly never pay for it.
+    """
     dcm = first_dicom(scan_path)
     if not dcm:
-        return session_fallback
+        return "", _session_cluster_fallback(mr_root)
     try:
-        ds = pydicom.dcmread(str(dcm), stop_before_pixels=True, force=True)
-        return scanner_cluster_from_ds(ds)
+        ds = pydicom.dcmread(
+            str(dcm),
+            stop_before_pixels=True,
+            force=True,
+            specific_tags=[(0x0008, 0x103E), *SCANNER_CLUSTER_TAGS],
+        )
     except Exception:
-        return session_fallback
+        return "", _session_cluster_fallback(mr_root)
+    sd = series_description(ds)
+    cls = classify_series(f"{scan_path.name} {sd}", rules)
+    return cls, scanner_cluster_from_ds(ds)
+
+
+def _conversion_row(
+    run_utc: str,
+    version: str,
+    session_id: str,
+    scan_path: Path,
+    d_in: Path,
+    cluster: str,
+    series_class: str,
+    status: str,
+    **overrides,
+) -> dict:
+    """Base conversion-log row; callers override only the fields their status sets."""
+    row = {
+        "run_utc": run_utc,
+        "dcm2niix_version": version,
+        "session_id": session_id,
+        "scan_folder": scan_path.name,
+        "scan_path": str(scan_path),
+        "dicom_input_dir": str(d_in),
+        "scanner_cluster": cluster,
+        "series_class": series_class,
+        "status": status,
+        "exit_code": "",
+        "duration_sec": "",
+        "stdout_tail": "",
+        "stderr_tail": "",
+        "n_nifti": 0,
+        "nifti_sample": "",
+        "convert_pass": False,
+        "rubric_note": "",
+        "cmd": "",
+    }
+    row.update(overrides)
+    return row
 
 
 def build_rows(
@@ -140,7 +199,6 @@ def build_rows(
 
     for mr_root in find_mr_roots(root):
         session_id = mr_root.name
-        sess_cluster = session_scanner_cluster(mr_root)
         scans = sorted(mr_root.glob("scans/*"))
         for s in scans:
             scan_path = Path(s)
@@ -149,60 +207,45 @@ def build_rows(
             scan_name = scan_path.name
             d_in = dicom_dir_for_scan(scan_path)
             out_sub = nifti_root / session_id / scan_name
-            cls = series_class_for_scan(scan_path, rules)
-            cluster = scanner_for_series(scan_path, sess_cluster)
 
-            if not d_in.is_dir() or not list(d_in.glob("*.dcm")):
+            # No DICOM means the header read below could only fall back to the
+            # session cluster anyway; check first and skip the probe.
+            if not d_in.is_dir() or next(d_in.glob("*.dcm"), None) is None:
                 rows.append(
-                    {
-                        "run_utc": run_utc,
-                        "dcm2niix_version": version,
-                        "session_id": session_id,
-                        "scan_folder": scan_name,
-                        "scan_path": str(scan_path),
-                        "dicom_input_dir": str(d_in),
-                        "scanner_cluster": cluster,
-                        "series_class": cls or "unknown",
-                        "status": "skip_no_dicom",
-                        "exit_code": "",
-                        "duration_sec": "",
-                        "stdout_tail": "",
-                        "stderr_tail": "",
-                        "n_nifti": 0,
-                        "nifti_sample": "",
-                        "convert_pass": False,
-                        "rubric_note": "no DICOM in resources/DICOM/files",
-                        "cmd": "",
-                    }
+                    _conversion_row(
+                        run_utc,
+                        version,
+                        session_id,
+                        scan_path,
+                        d_in,
+                        _session_cluster_fallback(mr_root),
+                        "unknown",
+                        "skip_no_dicom",
+                        rubric_note="no DICOM in resources/DICOM/files",
+                    )
                 )
                 n_done += 1
                 if limit is not None and n_done >= limit:
                     return rows
                 continue
 
+            cls, cluster = series_class_and_cluster(scan_path, rules, mr_root)
             cmd = f"{exe} -z y -f '%n_%s' -o {out_sub} {d_in}"
             if dry_run:
                 rows.append(
-                    {
-                        "run_utc": run_utc,
-                        "dcm2niix_version": version,
-                        "session_id": session_id,
-                        "scan_folder": scan_name,
-                        "scan_path": str(scan_path),
-                        "dicom_input_dir": str(d_in),
-                        "scanner_cluster": cluster,
-                        "series_class": cls or "other",
-                        "status": "dry_run",
-                        "exit_code": "",
-                        "duration_sec": "",
-                        "stdout_tail": "",
-                        "stderr_tail": "",
-                        "n_nifti": "",
-                        "nifti_sample": "",
-                        "convert_pass": "",
-                        "rubric_note": "",
-                        "cmd": cmd,
-                    }
+                    _conversion_row(
+                        run_utc,
+                        version,
+                        session_id,
+                        scan_path,
+                        d_in,
+                        cluster,
+                        cls or "other",
+                        "dry_run",
+                        n_nifti="",
+                        convert_pass="",
+                        cmd=cmd,
+                    )
                 )
                 n_done += 1
                 if limit is not None and n_done >= limit:
@@ -215,26 +258,25 @@ def build_rows(
             n_ni, sample = count_niftis(out_sub)
             passed = rubric_pass(code, n_ni)
             rows.append(
-                {
-                    "run_utc": run_utc,
-                    "dcm2niix_version": version,
-                    "session_id": session_id,
-                    "scan_folder": scan_name,
-                    "scan_path": str(scan_path),
-                    "dicom_input_dir": str(d_in),
-                    "scanner_cluster": cluster,
-                    "series_class": cls or "other",
-                    "status": "ran",
-                    "exit_code": code,
-                    "duration_sec": round(dt, 3),
-                    "stdout_tail": out_t,
-                    "stderr_tail": err_t,
-                    "n_nifti": n_ni,
-                    "nifti_sample": sample,
-                    "convert_pass": passed,
-                    "rubric_note": "exit==0 and n_nifti>=1",
-                    "cmd": cmd,
-                }
+                _conversion_row(
+                    run_utc,
+                    version,
+                    session_id,
+                    scan_path,
+                    d_in,
+                    cluster,
+                    cls or "other",
+                    "ran",
+                    exit_code=code,
+                    duration_sec=round(dt, 3),
+                    stdout_tail=out_t,
+                    stderr_tail=err_t,
+                    n_nifti=n_ni,
+                    nifti_sample=sample,
+                    convert_pass=passed,
+                    rubric_note="exit==0 and n_nifti>=1",
+                    cmd=cmd,
+                )
             )
             n_done += 1
             if limit is not None and n_done >= limit:
@@ -262,7 +304,6 @@ def build_rows_backfill(
 
     for mr_root in find_mr_roots(root):
         session_id = mr_root.name
-        sess_cluster = session_scanner_cluster(mr_root)
         scans = sorted(mr_root.glob("scans/*"))
         for s in scans:
             scan_path = Path(s)
@@ -271,73 +312,66 @@ def build_rows_backfill(
             scan_name = scan_path.name
             d_in = dicom_dir_for_scan(scan_path)
             out_sub = nifti_root / session_id / scan_name
-            cls = series_class_for_scan(scan_path, rules)
-            cluster = scanner_for_series(scan_path, sess_cluster)
 
-            if not d_in.is_dir() or not list(d_in.glob("*.dcm")):
+            # No DICOM means the header read below could only fall back to the
+            # session cluster anyway; check first and skip the probe.
+            if not d_in.is_dir() or next(d_in.glob("*.dcm"), None) is None:
                 rows.append(
-                    {
-                        "run_utc": run_utc,
-                        "dcm2niix_version": version,
-                        "session_id": session_id,
-                        "scan_folder": scan_name,
-                        "scan_path": str(scan_path),
-                        "dicom_input_dir": str(d_in),
-                        "scanner_cluster": cluster,
-                        "series_class": cls or "unknown",
-                        "status": "skip_no_dicom",
-                        "exit_code": "",
-                        "duration_sec": "",
-                        "stdout_tail": "",
-                        "stderr_tail": "",
-                        "n_nifti": 0,
-                        "nifti_sample": "",
-                        "convert_pass": False,
-                        "rubric_note": "no DICOM in resources/DICOM/files",
-                        "cmd": "",
-                    }
+                    _conversion_row(
+                        run_utc,
+                        version,
+                        session_id,
+                        scan_path,
+                        d_in,
+                        _session_cluster_fallback(mr_root),
+                        "unknown",
+                        "skip_no_dicom",
+                        rubric_note="no DICOM in resources/DICOM/files",
+                    )
                 )
                 continue
 
+            cls, cluster = series_class_and_cluster(scan_path, rules, mr_root)
             n_ni, sample = count_niftis(out_sub)
             code = 0 if rubric_pass(0, n_ni) else 1
             passed = rubric_pass(code, n_ni)
             rows.append(
-                {
-                    "run_utc": run_utc,
-                    "dcm2niix_version": version,
-                    "session_id": session_id,
-                    "scan_folder": scan_name,
-                    "scan_path": str(scan_path),
-                    "dicom_input_dir": str(d_in),
-                    "scanner_cluster": cluster,
-                    "series_class": cls or "other",
-                    "status": "backfill_from_nifti",
-                    "exit_code": code,
-                    "duration_sec": "",
-                    "stdout_tail": "",
-                    "stderr_tail": "BACKFILL_FROM_NIFTI: pass/fail inferred from files under nifti_root; not a live run",
-                    "n_nifti": n_ni,
-                    "nifti_sample": sample,
-                    "convert_pass": passed,
-                    "rubric_note": "backfill_from_nifti: exit inferred; pass = (code==0 and n_nifti>=1)",
-                    "cmd": f"[backfill] would be: {exe} -z y -f '%n_%s' -o {out_sub} {d_in}",
-                }
+                _conversion_row(
+                    run_utc,
+                    version,
+                    session_id,
+                    scan_path,
+                    d_in,
+                    cluster,
+                    cls or "other",
+                    "backfill_from_nifti",
+                    exit_code=code,
+                    stderr_tail="BACKFILL_FROM_NIFTI: pass/fail inferred from files under nifti_root; not a live run",
+                    n_nifti=n_ni,
+                    nifti_sample=sample,
+                    convert_pass=passed,
+                    rubric_note="backfill_from_nifti: exit inferred; pass = (code==0 and n_nifti>=1)",
+                    cmd=f"[backfill] would be: {exe} -z y -f '%n_%s' -o {out_sub} {d_in}",
+                )
             )
 
     return rows
 
 
+# Statuses that count toward Table 2; dry_run and skip_no_dicom are excluded.
+_TABLE2_STATUSES = frozenset({"ran", "backfill_from_nifti"})
+
+
 def _rows_for_table2(df: pd.DataFrame) -> pd.DataFrame:
     """Live runs plus backfill-from-disk rows; exclude dry_run and skip_no_dicom."""
-    return df[df["status"].isin(("ran", "backfill_from_nifti"))].copy()
+    return df[df["status"].isin(_TABLE2_STATUSES)]
 
 
 def write_table2_figure2(df: pd.DataFrame, out_dir: Path) -> None:
     ran = _rows_for_table2(df)
     if ran.empty:
         return
-    ran["convert_pass"] = ran["convert_pass"].astype(bool)
+    ran = ran.assign(convert_pass=ran["convert_pass"].astype(bool))
 
     # Cell: scanner × class → pass rate & counts
     g = (
@@ -355,7 +389,6 @@ def write_table2_figure2(df: pd.DataFrame, out_dir: Path) -> None:
 
     try:
         import matplotlib.pyplot as plt
-        import numpy as np
 
         pivot = ran.pivot_table(
             index="scanner_cluster",
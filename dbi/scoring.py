@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -46,8 +47,32 @@ def _f(v: Any) -> float | None:
 def load_yaml_config(path: Path) -> dict:
     import yaml
 
+    # Prefer the libyaml-backed loader when PyYAML was built with it; same
+    # safe-loading semantics, much faster parse.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=loader)
+
+
+@lru_cache(maxsize=None)
+def _compiled_or_none(pat: str, flags: int = 0) -> re.Pattern[str] | None:
+    """Compile a config-supplied pattern once; None when it does not parse."""
+    try:
+        return re.compile(pat, flags)
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _compiled_all_match(patterns: tuple[str, ...]) -> tuple[re.Pattern[str] | None, ...]:
+    """Compile a class's all_match battery once; None marks an invalid pattern."""
+    out: list[re.Pattern[str] | None] = []
+    for pat in patterns:
+        try:
+            out.append(re.compile(pat, re.DOTALL))
+        except re.error:
+            out.append(None)
+    return tuple(out)
 
 
 def standards_classify(
@@ -64,19 +89,10 @@ def standards_classify(
         return "unclassifiable"
     for cls in sorted(class_sd_compliance.keys()):
         rule = class_sd_compliance[cls]
-        all_match = rule.get("all_match") or []
+        all_match = tuple(rule.get("all_match") or ())
         if not all_match:
             continue
-        ok = True
-        for pat in all_match:
-            try:
-                if not re.search(pat, text, re.DOTALL):
-                    ok = False
-                    break
-            except re.error:
-                ok = False
-                break
-        if ok:
+        if all(rx is not None and rx.search(text) for rx in _compiled_all_match(all_match)):
             return cls
     return "unclassifiable"
 
@@ -117,13 +133,13 @@ def standards_gap_reason(
     descriptions = _RULE_DESCRIPTIONS.get(heuristic_class, [])
 
     failed = []
-    for i, pat in enumerate(all_match):
-        try:
-            if not re.search(pat, text, re.DOTALL):
-                desc = descriptions[i] if i < len(descriptions) else f"pattern {pat}"
-                failed.append(desc)
-        except re.error:
+    compiled = _compiled_all_match(tuple(all_match))
+    for i, (pat, rx) in enumerate(zip(all_match, compiled)):
+        if rx is None:
             failed.append(f"invalid pattern: {pat}")
+        elif not rx.search(text):
+            desc = descriptions[i] if i < len(descriptions) else f"pattern {pat}"
+            failed.append(desc)
 
     if not failed:
         return "Already compliant"
@@ -149,25 +165,56 @@ def recommended_name_for_class(series_class: str) -> str:
     return _RECOMMENDED_PATTERNS.get(series_class, "")
 
 
-def classify_series(text: str, rules: list[dict]) -> str:
-    t = text
-    for rule in rules:
-        cls = rule["class"]
-        patterns = rule.get("patterns") or []
+@lru_cache(maxsize=None)
+def _compiled_classification_rules(
+    rules_key: tuple[tuple[str, tuple[str, ...]], ...]
+) -> tuple:
+    """
+    Pre-resolve each pattern to either a compiled case-insensitive regex or a
+    lowercased literal, once per distinct rule set. matchers is None for the
+    bare 'other' catch-all rule.
+    """
+    compiled = []
+    for cls, patterns in rules_key:
         if cls == "other" and not patterns:
-            return "other"
+            compiled.append((cls, None))
+            continue
+        matchers = []
         for pat in patterns:
             if not pat:
                 continue
             if any(c in pat for c in r".*+?[]()|^$\\") and not pat.isalnum():
-                if re.search(pat, t, re.IGNORECASE):
-                    return cls
+                matchers.append((True, re.compile(pat, re.IGNORECASE)))
             else:
-                if pat.lower() in t.lower():
+                matchers.append((False, pat.lower()))
+        compiled.append((cls, tuple(matchers)))
+    return tuple(compiled)
+
+
+def classify_series(text: str, rules: list[dict]) -> str:
+    rules_key = tuple((rule["class"], tuple(rule.get("patterns") or ())) for rule in rules)
+    t_lower = text.lower()
+    for cls, matchers in _compiled_classification_rules(rules_key):
+        if matchers is None:
+            return cls
+        for is_regex, matcher in matchers:
+            if is_regex:
+                if matcher.search(text):
                     return cls
+            elif matcher in t_lower:
+                return cls
     return "other"
 
 
+# Tags needed by scanner_cluster_from_ds; callers that only derive the cluster
+# can pass these as dcmread(specific_tags=...) instead of keeping every element.
+SCANNER_CLUSTER_TAGS: list[tuple[int, int]] = [
+    (0x0008, 0x0070),  # Manufacturer
+    (0x0008, 0x1090),  # ManufacturerModelName
+    (0x0018, 0x0087),  # MagneticFieldStrength
+]
+
+
 def scanner_cluster_from_ds(ds: Dataset) -> str:
     man = _s(elem_value(ds, (0x0008, 0x0070)))
     model = _s(elem_value(ds, (0x0008, 0x1090)))
@@ -175,17 +222,22 @@ def scanner_cluster_from_ds(ds: Dataset) -> str:
     return f"{man} | {model} | {b0}T".strip()
 
 
+@lru_cache(maxsize=None)
+def _derivative_token_regex(tokens: tuple[str, ...]) -> re.Pattern[str] | None:
+    # One alternation instead of a pattern per token: the scan over the text
+    # happens once regardless of how many tokens are configured. Longer tokens
+    # first so the alternation prefers full matches; token as path segment or
+    # delimiter-wrapped. Compiled once per distinct token set (the config list
+    # is stable for a whole run).
+    toks = [re.escape(tok.upper()) for tok in sorted(tokens, key=len, reverse=True) if tok]
+    if not toks:
+        return None
+    return re.compile(r"(^|[_\s\-])(?:" + "|".join(toks) + r")($|[_\s\-])")
+
+
 def is_derivative_dwi_name(combined: str, tokens: list[str]) -> bool:
-    u = combined.upper()
-    # Longer tokens first to avoid partial matches
-    for tok in sorted(tokens, key=len, reverse=True):
-        if not tok:
-            continue
-        # Token as path segment or delimiter-wrapped
-        rx = re.compile(r"(^|[_\s\-])" + re.escape(tok.upper()) + r"($|[_\s\-])")
-        if rx.search(u):
-            return True
-    return False
+    rx = _derivative_token_regex(tuple(tokens))
+    return bool(rx is not None and rx.search(combined.upper()))
 
 
 def has_diffusion_evidence(ds: Dataset) -> tuple[bool, str]:
@@ -232,32 +284,8 @@ def has_gradient_direction_info(ds: Dataset) -> bool:
     return False
 
 
-def score_M(ds: Dataset, cls: str, spatial_cfg: dict) -> tuple[float, int, int]:
-    """Return (score, n_pass, n_total)."""
-    checks: list[bool] = []
-
-    def add(cond: bool) -> None:
-        checks.append(cond)
-
-    mod = _s(elem_value(ds, (0x0008, 0x0060))).upper()
-    add(mod == "MR")
-    add(bool(_s(elem_value(ds, (0x0008, 0x0070)))))
-    add(bool(_s(elem_value(ds, (0x0008, 0x1090)))))
-    b0v = elem_value(ds, (0x0018, 0x0087))
-    add(_f(b0v) is not None and _f(b0v) > 0)
-    add(bool(_s(elem_value(ds, (0x0020, 0x000E)))))
-    add(bool(_s(elem_value(ds, (0x0020, 0x000D)))))
-
-    sd = series_description(ds)
-    pn = _s(elem_value(ds, (0x0018, 0x1030)))
-    add(bool(sd) or bool(pn))
-
-    if cls == "localizer":
-        n_pass = sum(checks)
-        n_total = len(checks)
-        return (n_pass / n_total if n_total else 0.0, n_pass, n_total)
-
-    # Spatial
+def _spatial_checks(ds: Dataset, spatial_cfg: dict) -> tuple[bool, bool]:
+    """Return (in_plane_ok, slice_ok); the checks score_M and score_S share."""
     ps = elem_value(ds, (0x0028, 0x0030))
     ips = elem_value(ds, (0x0018, 0x1164))
     in_plane_ok = False
@@ -271,7 +299,6 @@ def score_M(ds: Dataset, cls: str, spatial_cfg: dict) -> tuple[float, int, int]:
                 if lo <= a <= hi and lo <= b <= hi:
                     in_plane_ok = True
                     break
-    add(in_plane_ok)
 
     st = _f(elem_value(ds, (0x0018, 0x0050)))
     sbs = _f(elem_value(ds, (0x0018, 0x0088)))
@@ -281,6 +308,34 @@ def score_M(ds: Dataset, cls: str, spatial_cfg: dict) -> tuple[float, int, int]:
         slice_ok = True
     if sbs is not None and slo <= sbs <= shi:
         slice_ok = True
+    return in_plane_ok, slice_ok
+
+
+def score_M(ds: Dataset, cls: str, spatial_cfg: dict) -> tuple[float, int, int]:
+    """Return (score, n_pass, n_total)."""
+    checks: list[bool] = []
+    add = checks.append
+
+    mod = _s(elem_value(ds, (0x0008, 0x0060))).upper()
+    add(mod == "MR")
+    add(bool(_s(elem_value(ds, (0x0008, 0x0070)))))
+    add(bool(_s(elem_value(ds, (0x0008, 0x1090)))))
+    b0 = _f(elem_value(ds, (0x0018, 0x0087)))
+    add(b0 is not None and b0 > 0)
+    add(bool(_s(elem_value(ds, (0x0020, 0x000E)))))
+    add(bool(_s(elem_value(ds, (0x0020, 0x000D)))))
+
+    sd = series_description(ds)
+    pn = _s(elem_value(ds, (0x0018, 0x1030)))
+    add(bool(sd) or bool(pn))
+
+    if cls == "localizer":
+        n_pass = sum(checks)
+        n_total = len(checks)
+        return (n_pass / n_total if n_total else 0.0, n_pass, n_total)
+
+    in_plane_ok, slice_ok = _spatial_checks(ds, spatial_cfg)
+    add(in_plane_ok)
     add(slice_ok)
 
     if cls == "dwi":
@@ -301,9 +356,14 @@ def score_M(ds: Dataset, cls: str, spatial_cfg: dict) -> tuple[float, int, int]:
     return (n_pass / n_total if n_total else 0.0, n_pass, n_total)
 
 
-def score_P(scan_basename: str, ds: Dataset, protocol_pattern: str) -> tuple[float, float, float]:
+_SCAN_FOLDER_RE = re.compile(r"^[0-9]+-")
+
+
+def score_P(
+    scan_basename: str, ds: Dataset, protocol_pattern: str | re.Pattern[str]
+) -> tuple[float, float, float]:
     """Return (P_composite, P_minimal, P_ideal)."""
-    folder_ok = bool(re.match(r"^[0-9]+-", scan_basename))
+    folder_ok = bool(_SCAN_FOLDER_RE.match(scan_basename))
     sd = series_description(ds)
     pn = _s(elem_value(ds, (0x0018, 0x1030)))
     text_ok = bool(sd) or bool(pn)
@@ -318,29 +378,7 @@ def score_S(ds: Dataset, cls: str, spatial_cfg: dict) -> float:
     if cls == "localizer":
         return 1.0  # N/A treated as full credit for S per spec option (exclude from strict spatial)
 
-    ps = elem_value(ds, (0x0028, 0x0030))
-    ips = elem_value(ds, (0x0018, 0x1164))
-    in_plane_ok = False
-    for val in (ps, ips):
-        if val is None or val == "":
-            continue
-        if isinstance(val, (list, tuple, MultiValue)) and len(val) >= 2:
-            a, b = _f(val[0]), _f(val[1])
-            if a and b and a > 0 and b > 0:
-                lo, hi = spatial_cfg["min_pixel_spacing_mm"], spatial_cfg["max_pixel_spacing_mm"]
-                if lo <= a <= hi and lo <= b <= hi:
-                    in_plane_ok = True
-                    break
-
-    st = _f(elem_value(ds, (0x0018, 0x0050)))
-    sbs = _f(elem_value(ds, (0x0018, 0x0088)))
-    slo, shi = spatial_cfg["min_slice_thickness_mm"], spatial_cfg["max_slice_thickness_mm"]
-    slice_ok = False
-    if st is not None and slo <= st <= shi:
-        slice_ok = True
-    if sbs is not None and slo <= sbs <= shi:
-        slice_ok = True
-
+    in_plane_ok, slice_ok = _spatial_checks(ds, spatial_cfg)
     if in_plane_ok and slice_ok:
         return 1.0
     if in_plane_ok:
@@ -351,7 +389,7 @@ def score_S(ds: Dataset, cls: str, spatial_cfg: dict) -> float:
 def score_N(
     scan_basename: str,
     ds: Dataset,
-    folder_regex: str,
+    folder_regex: str | re.Pattern[str],
     automation_conventions: list[dict] | None = None,
     series_class: str = "other",
     class_sd_compliance: dict[str, dict] | None = None,
@@ -380,28 +418,21 @@ def score_N(
             pat = conv.get("regex") or conv.get("pattern")
             if not pat:
                 continue
-            try:
-                parts.append(1.0 if re.search(pat, combined, re.DOTALL) else 0.0)
-            except re.error:
-                parts.append(0.0)
+            rx = _compiled_or_none(pat, re.DOTALL)
+            parts.append(1.0 if rx is not None and rx.search(combined) else 0.0)
 
     sd_stripped = sd.strip()
     if class_sd_compliance and series_class in class_sd_compliance:
         rule = class_sd_compliance[series_class]
-        all_match = rule.get("all_match") or []
+        all_match = tuple(rule.get("all_match") or ())
         if all_match:
             if not sd_stripped:
                 parts.append(0.0)
             else:
-                ok = True
-                for pat in all_match:
-                    try:
-                        if not re.search(pat, sd_stripped, re.DOTALL):
-                            ok = False
-                            break
-                    except re.error:
-                        ok = False
-                        break
+                ok = all(
+                    rx is not None and rx.search(sd_stripped)
+                    for rx in _compiled_all_match(all_match)
+                )
                 parts.append(1.0 if ok else 0.0)
 
     if derived_scan_naming and derived_scan_naming.get("enabled", True) and combined:
@@ -414,10 +445,8 @@ def score_N(
             if not sd_stripped:
                 parts.append(0.0)
             else:
-                try:
-                    parts.append(1.0 if re.search(suf_pat, sd_stripped) else 0.0)
-                except re.error:
-                    parts.append(0.0)
+                rx = _compiled_or_none(suf_pat)
+                parts.append(1.0 if rx is not None and rx.search(sd_stripped) else 0.0)
 
     n_total = len(parts)
     n_pass = int(sum(parts))
@@ -0,0 +1,25 @@
+"""Unit tests for Phase 2 audit helpers."""
+
+from pathlib import Path
+
+try:
+    from dbi.run_audit import run_audit
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from run_audit import run_audit
+
+CONFIG = Path(__file__).resolve().parents[1] / "dbi_v1_config.yaml"
+
+
+def test_run_audit_empty_root_xnat(tmp_path: Path):
+    series_df, session_df, version = run_audit(tmp_path, tmp_path, CONFIG, layout="xnat")
+    assert series_df.empty
+    assert session_df.empty
+    assert version
+
+
+def test_run_audit_empty_root_uid_tree(tmp_path: Path):
+    series_df, session_df, _ = run_audit(tmp_path, tmp_path, CONFIG, layout="uid-tree")
+    assert series_df.empty
+    assert session_df.empty
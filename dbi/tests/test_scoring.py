@@ -6,11 +6,11 @@ import pydicom
 from pydicom.dataset import Dataset, FileMetaDataset
 
 try:
-    from dbi.scoring import composite_dbi, elem_value, score_N, series_description
+    from dbi.scoring import classify_series, composite_dbi, elem_value, score_N, series_description
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-    from scoring import composite_dbi, elem_value, score_N, series_description
+    from scoring import classify_series, composite_dbi, elem_value, score_N, series_description
 
 DEFAULT_DERIVED = {
     "enabled": True,
@@ -121,6 +121,18 @@ def test_score_N_derived_scan_requires_suffix():
     assert p2 == 3  # derivative marker hit, suffix missing
 
 
+def test_classify_series_literal_regex_and_catchall():
+    rules = [
+        {"class": "dwi", "patterns": [r"(?i)\bDTI\b", "diffusion"]},
+        {"class": "t1_anat", "patterns": ["T1"]},
+        {"class": "other", "patterns": []},
+    ]
+    assert classify_series("AX DTI 64dir", rules) == "dwi"
+    assert classify_series("Ax Diffusion trace", rules) == "dwi"
+    assert classify_series("SAG t1 MPRAGE", rules) == "t1_anat"
+    assert classify_series("localizer", rules) == "other"
+
+
 def test_score_N_t2_anat_compliance():
     comp = {
         "t2_anat": {